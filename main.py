@@ -506,6 +506,12 @@ def open_edit_for_last_game(matches: List[str]) -> List[str] | None:
     """
     global _last_selected_game
     g = _last_selected_game
+    # Games added from the editor are inserted in the background; let them land so the lookup below finds them
+    try:
+        from game_editor import wait_for_pending_imports  # type: ignore
+        wait_for_pending_imports()
+    except Exception:
+        pass
     # If an explicit title is provided after the command, try to resolve it
     if matches:
         maybe_title = matches[0]
@@ -773,6 +779,9 @@ def show_help(matches: List[str]) -> List[str] | None:
             "is half life alyx free",
             "when was doom eternal made",
             "add a game",
+            "add several games",
+            "batch add games",
+            "check batch",
         ])
     ]
 
@@ -822,6 +831,84 @@ def open_add_game_ui(matches: List[str]) -> List[str] | None:
         console.print("[red]Unable to open the game editor right now.[/red]")
         return ["No answers"]
 
+# Classify several titles concurrently and add them together
+def open_bulk_add_ui(matches: List[str]) -> List[str] | None:
+    """
+    Open the bulk add flow, which classifies several titles at once and adds the ones the user confirms.
+    
+    Like the Add Game UI, this requires an OpenAI API key; without one a warning is shown and control returns to the prompt.
+    
+    Parameters:
+    	matches (List[str]): Captured tokens from the matched pattern (unused).
+    
+    Returns:
+    	None to continue the interactive loop, `['No answers']` if the editor failed to open.
+    """
+    has_key = bool(os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_API_TOKEN"))
+    if not has_key:
+        try:
+            from game_editor import print_openai_missing_warning  # type: ignore
+            print_openai_missing_warning()
+        except Exception:
+            console.print("[yellow]Adding games requires an OpenAI API key. Set OPENAI_API_KEY and restart.[/yellow]")
+        return None
+    try:
+        from game_editor import bulk_add_ui
+        bulk_add_ui()
+        return None
+    except Exception:
+        console.print("[red]Unable to open the game editor right now.[/red]")
+        return ["No answers"]
+
+# Submit many titles at once through the OpenAI Batch API
+def open_batch_add_ui(matches: List[str]) -> List[str] | None:
+    """
+    Open the batch add flow, which submits several titles as one OpenAI Batch API job.
+    
+    Like the Add Game UI, this requires an OpenAI API key; without one a warning is shown and control returns to the prompt.
+    
+    Parameters:
+    	matches (List[str]): Captured tokens from the matched pattern (unused).
+    
+    Returns:
+    	None to continue the interactive loop, `['No answers']` if the editor failed to open.
+    """
+    has_key = bool(os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_API_TOKEN"))
+    if not has_key:
+        try:
+            from game_editor import print_openai_missing_warning  # type: ignore
+            print_openai_missing_warning()
+        except Exception:
+            console.print("[yellow]Batch add requires an OpenAI API key. Set OPENAI_API_KEY and restart.[/yellow]")
+        return None
+    try:
+        from game_editor import submit_batch_ui
+        submit_batch_ui()
+        return None
+    except Exception:
+        console.print("[red]Unable to open the game editor right now.[/red]")
+        return ["No answers"]
+
+# Import the results of a submitted batch once it has finished
+def check_batch(matches: List[str]) -> List[str] | None:
+    """
+    Collect a classification batch and queue its games for import.
+    
+    Parameters:
+    	matches (List[str]): Optional batch id; without one the last batch submitted this session is used.
+    
+    Returns:
+    	None to continue the interactive loop, `['No answers']` if the batch could not be checked.
+    """
+    batch_id = matches[0] if matches else None
+    try:
+        from game_editor import collect_batch_ui
+        collect_batch_ui(batch_id)
+        return None
+    except Exception:
+        console.print("[red]Unable to check the batch right now.[/red]")
+        return ["No answers"]
+
 # The pattern-action list for the natural language query system
 # A list of tuples of pattern and action
 pa_list: List[Tuple[List[str], Callable[[List[str]], List[Any]]]] = [
@@ -830,6 +917,13 @@ pa_list: List[Tuple[List[str], Callable[[List[str]], List[Any]]]] = [
     (str.split("add game"), open_add_game_ui),
     (str.split("create game"), open_add_game_ui),
     (str.split("new game"), open_add_game_ui),
+    (str.split("add games"), open_bulk_add_ui),
+    (str.split("add several games"), open_bulk_add_ui),
+    # Batch API commands
+    (str.split("batch add games"), open_batch_add_ui),
+    (str.split("batch add"), open_batch_add_ui),
+    (str.split("check batch"), check_batch),
+    (str.split("check batch _"), check_batch),
     # Quick edit commands
     (str.split("edit"), open_edit_for_last_game),
     (str.split("edit %"), open_edit_for_last_game),